@@ -98,25 +98,40 @@ export default function Transactions() {
     }
   };
 
+  const normalizedQuery = searchQuery.toLowerCase();
+
   const filteredTransactions = transactions.filter((transaction) => {
-    const matchesSearch =
-      !searchQuery ||
-      transaction.description?.toLowerCase().includes(searchQuery.toLowerCase()) ||
-      transaction.merchantName?.toLowerCase().includes(searchQuery.toLowerCase());
-    
-    const matchesAccount = !selectedAccount || transaction.accountId === selectedAccount;
-    const matchesCategory = !selectedCategory || transaction.categoryId === selectedCategory;
-    const matchesType = !selectedType || transaction.transactionType === selectedType;
-    
-    return matchesSearch && matchesAccount && matchesCategory && matchesType;
+    // Cheap equality checks first so rejected rows skip the substring search
+    if (selectedAccount && transaction.accountId !== selectedAccount) return false;
+    if (selectedCategory && transaction.categoryId !== selectedCategory) return false;
+    if (selectedType && transaction.transactionType !== selectedType) return false;
+
+    return (
+      !normalizedQuery ||
+      !!transaction.description?.toLowerCase().includes(normalizedQuery) ||
+      !!transaction.merchantName?.toLowerCase().includes(normalizedQuery)
+    );
   });
 
+  let totalIncome = 0;
+  let totalExpenses = 0;
+  for (const transaction of filteredTransactions) {
+    if (transaction.transactionType === 'CREDIT') {
+      totalIncome += transaction.amount;
+    } else if (transaction.transactionType === 'DEBIT') {
+      totalExpenses += transaction.amount;
+    }
+  }
+
+  const categoryNames = new Map(categories.map((c) => [c.id, c.categoryName] as const));
+  const accountNames = new Map(accounts.map((a) => [a.id, a.accountName] as const));
+
   const getCategoryName = (categoryId?: string) => {
-    return categories.find((c) => c.id === categoryId)?.categoryName || 'Uncategorized';
+    return (categoryId && categoryNames.get(categoryId)) || 'Uncategorized';
   };
 
   const getAccountName = (accountId: string) => {
-    return accounts.find((a) => a.id === accountId)?.accountName || 'Unknown';
+    return accountNames.get(accountId) || 'Unknown';
   };
 
   return (
@@ -351,35 +366,19 @@ export default function Transactions() {
         <div className="card bg-green-50 border-green-200">
           <p className="text-sm text-green-600 font-medium">Total Income</p>
           <p className="text-2xl font-bold text-green-700 mt-1">
-            $
-            {filteredTransactions
-              .filter((t) => t.transactionType === 'CREDIT')
-              .reduce((sum, t) => sum + t.amount, 0)
-              .toFixed(2)}
+            ${totalIncome.toFixed(2)}
           </p>
         </div>
         <div className="card bg-red-50 border-red-200">
           <p className="text-sm text-red-600 font-medium">Total Expenses</p>
           <p className="text-2xl font-bold text-red-700 mt-1">
-            $
-            {filteredTransactions
-              .filter((t) => t.transactionType === 'DEBIT')
-              .reduce((sum, t) => sum + t.amount, 0)
-              .toFixed(2)}
+            ${totalExpenses.toFixed(2)}
           </p>
         </div>
         <div className="card bg-primary-50 border-primary-200">
           <p className="text-sm text-primary-600 font-medium">Net</p>
           <p className="text-2xl font-bold text-primary-700 mt-1">
-            $
-            {(
-              filteredTransactions
-                .filter((t) => t.transactionType === 'CREDIT')
-                .reduce((sum, t) => sum + t.amount, 0) -
-              filteredTransactions
-                .filter((t) => t.transactionType === 'DEBIT')
-                .reduce((sum, t) => sum + t.amount, 0)
-            ).toFixed(2)}
+            ${(totalIncome - totalExpenses).toFixed(2)}
           </p>
         </div>
       </div>